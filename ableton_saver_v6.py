@@ -1,21 +1,40 @@
 import sys
 import time
-import re
 import os
 import subprocess
-import webbrowser
+from functools import partial
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QLabel, QPushButton, QLineEdit, QFrame, QGraphicsDropShadowEffect,
-    QButtonGroup, QSystemTrayIcon, QMenu,
+    QLabel, QPushButton, QLineEdit, QFrame,
+    QSystemTrayIcon, QMenu,
     QGraphicsView, QGraphicsScene
 )
-from PyQt6.QtCore import Qt, QTimer, QPoint, QSize, QPropertyAnimation, QEasingCurve, QRect
+from PyQt6.QtCore import (
+    Qt, QTimer, QPoint, QRect, QMetaObject, QObject, QRunnable, QThreadPool,
+    pyqtSignal, pyqtSlot
+)
 from PyQt6.QtGui import (
-    QColor, QPainter, QBrush, QPen, QFont, QCursor,
-    QIcon, QAction, QPixmap, QPolygon, QKeySequence
+    QColor, QPainter, QBrush, QPen, QCursor, QFont, QFontMetrics,
+    QIcon, QAction, QPixmap, QPolygon, QKeySequence, QStaticText, QTransform
 )
 
+try:
+    from Quartz import (
+        CGEventCreateKeyboardEvent, CGEventSetFlags, CGEventPost,
+        kCGHIDEventTap, kCGEventFlagMaskCommand
+    )
+except ImportError:  # non-macOS dev environment
+    CGEventPost = None
+
+try:
+    from AppKit import NSWorkspace, NSEvent
+except ImportError:  # non-macOS dev environment
+    NSWorkspace = None
+    NSEvent = None
+
+# NSEventMaskKeyDown
+NSKeyDownMask = 1 << 10
+
 # --- DESIGN SYSTEM ---
 COLOR_ACCENT = "#D4FF00"
 COLOR_DANGER = "#FF5F56"
@@ -38,59 +57,471 @@ TRIANGLE_WHATSAPP_URL = "https://chat.whatsapp.com/Bxkdz1ZzA7l3Trdz1x9far"
 INSTA_IDO_URL = "https://www.instagram.com/ido_triangle/"
 INSTA_AMIT_URL = "https://www.instagram.com/amit.triangle/"
 
+# (text, url, bg, fg, hover) — built in a loop in build_ui
+SOCIAL_BUTTONS = [
+    ("Join Discord", TRIANGLE_DISCORD_URL, "#5865F2", "white", "#7289da"),
+    ("Join WhatsApp", TRIANGLE_WHATSAPP_URL, "#25D366", "white", "#4CE77F"),
+]
+INSTA_BUTTONS = [
+    ("@ido_triangle", INSTA_IDO_URL),
+    ("@amit.triangle", INSTA_AMIT_URL),
+]
+
 # Sound
 TIMER_SOUND_FILE = "/System/Library/Sounds/Glass.aiff"
 
+# One application-wide stylesheet, parsed by Qt a single time. Widgets whose
+# look never changes are selected by object name here; widgets that swap
+# styles at runtime keep their precompiled per-widget sheets below.
+GLOBAL_QSS = f"""
+    QPushButton#btnClose {{
+        background-color: {COLOR_DANGER};
+        border: none;
+        border-radius: 7px;
+    }}
+    QPushButton#btnClose:hover {{ background-color: #FF7B75; }}
+    QPushButton#btnMinimize {{
+        background-color: {COLOR_YELLOW};
+        border: none;
+        border-radius: 7px;
+    }}
+    QPushButton#btnMinimize:hover {{ background-color: #FFD062; }}
+    QPushButton#btnTimerMode {{
+        background-color: {COLOR_GREEN};
+        border: none;
+        border-radius: 7px;
+    }}
+    QPushButton#btnTimerMode:hover {{ background-color: #4AE567; }}
+
+    QLabel#subtitle {{
+        color: {COLOR_TEXT_SECONDARY};
+        font-family: 'Helvetica Neue';
+        font-size: 18px;
+    }}
+    QLabel#desc {{
+        color: {COLOR_TEXT_DIM};
+        font-family: 'Helvetica Neue';
+        font-size: 13px;
+    }}
+    QLabel#timerDesc {{
+        color: {COLOR_ACCENT};
+        font-family: 'Helvetica Neue';
+        font-size: 10px;
+    }}
+    QLabel#sectionLabel {{
+        color: {COLOR_TEXT_DIM};
+        font-family: 'Helvetica Neue';
+        font-size: 10px;
+    }}
+    QLabel#settingLabel {{
+        color: {COLOR_TEXT_SECONDARY};
+        font-family: 'Helvetica Neue';
+        font-size: 12px;
+    }}
+    QLabel#footer {{
+        color: #444444;
+        font-family: 'Helvetica Neue';
+        font-size: 10px;
+    }}
+    QFrame#customFrame {{
+        background-color: {COLOR_BG_SECONDARY};
+        border: 1px solid #333333;
+        border-radius: 18px;
+    }}
+    QFrame#separator {{ background-color: #222222; }}
+    QLineEdit#customEntry {{
+        background-color: #0a0a0a;
+        color: {COLOR_TEXT_PRIMARY};
+        border: 1px solid #333333;
+        border-radius: 16px;
+        padding: 5px;
+        font-family: 'Helvetica Neue';
+        font-weight: bold;
+        font-size: 12px;
+    }}
+    QPushButton#btnSet {{
+        background-color: {COLOR_ACCENT};
+        color: black;
+        border: none;
+        border-radius: 15px;
+        font-family: 'Helvetica Neue';
+        font-size: 11px;
+        font-weight: bold;
+    }}
+    QPushButton#btnSet:hover {{ background-color: #E2FF4D; }}
+
+    IntervalButton {{
+        background-color: transparent;
+        color: {COLOR_TEXT_DIM};
+        border: 1px solid #444444;
+        border-radius: 15px;
+        font-family: 'Helvetica Neue';
+        font-size: 12px;
+        font-weight: bold;
+    }}
+    IntervalButton:hover {{ background-color: #1a1a1a; }}
+    IntervalButton[selected="true"] {{
+        background-color: {COLOR_ACCENT};
+        color: black;
+        border: none;
+    }}
+
+    QPushButton#linkBtn {{
+        background-color: transparent;
+        color: {COLOR_ACCENT};
+        border: 2px solid {COLOR_ACCENT};
+        border-radius: 15px;
+        font-family: 'Helvetica Neue';
+        font-size: 11px;
+        font-weight: bold;
+    }}
+    QPushButton#linkBtn:hover {{ background-color: rgba(212, 255, 0, 0.1); }}
+
+    QPushButton#unitBtn {{
+        background-color: #222222;
+        color: {COLOR_TEXT_DIM};
+        border: none;
+        border-radius: 8px;
+        font-family: 'Helvetica Neue';
+        font-size: 10px;
+    }}
+    QPushButton#unitBtn:hover {{ background-color: #333333; }}
+    QPushButton#unitBtn[selected="true"] {{
+        background-color: {COLOR_ACCENT};
+        color: black;
+        font-weight: bold;
+    }}
+    QPushButton#unitBtn[selected="true"]:hover {{ background-color: {COLOR_ACCENT}; }}
+
+    QPushButton#toggleBtn {{
+        background-color: {COLOR_ACCENT};
+        color: black;
+        border: none;
+        border-radius: 18px;
+        padding: 10px 20px;
+        font-family: 'Helvetica Neue';
+        font-size: 13px;
+        font-weight: bold;
+    }}
+    QPushButton#toggleBtn:hover {{ background-color: #E2FF4D; }}
+    QPushButton#toggleBtn[running="true"] {{
+        background-color: {COLOR_DANGER};
+        color: white;
+    }}
+    QPushButton#toggleBtn[running="true"]:hover {{ background-color: #FF7B75; }}
+
+    QPushButton#shortcutInput {{
+        background-color: #0a0a0a;
+        color: {COLOR_ACCENT};
+        border: 1px solid #333333;
+        border-radius: 14px;
+        font-family: 'Helvetica Neue';
+        font-size: 11px;
+        font-weight: bold;
+    }}
+    QPushButton#shortcutInput:hover {{ border-color: {COLOR_ACCENT}; }}
+    QPushButton#shortcutInput[recording="true"] {{
+        color: {COLOR_DANGER};
+        border: 2px solid {COLOR_DANGER};
+    }}
+    QPushButton#shortcutInput[recording="true"]:hover {{ border-color: {COLOR_DANGER}; }}
+    QPushButton#switch {{
+        background-color: #333333;
+        border: none;
+        border-radius: 13px;
+        text-align: left;
+        padding-left: 3px;
+        color: white;
+    }}
+    QPushButton#switch:checked {{
+        background-color: {COLOR_ACCENT};
+        text-align: right;
+        padding-left: 0px;
+        padding-right: 3px;
+        color: black;
+    }}
+"""
+
+# Shared pointing-hand cursor, created once after the QApplication exists
+# (every button used to allocate its own identical QCursor)
+_POINTER_CURSOR = None
+
+
+# Modifier display prefixes ("Ctrl+Shift+", ...) indexed by a 4-bit mask:
+# bit 0 = Ctrl, bit 1 = Shift, bit 2 = Alt, bit 3 = Cmd
+_MOD_PREFIX = tuple(
+    "".join(name + "+"
+            for bit, name in ((1, "Ctrl"), (2, "Shift"), (4, "Alt"), (8, "Cmd"))
+            if mask & bit)
+    for mask in range(16)
+)
+
+# Resize-edge lookup tables indexed by a 4-bit mask:
+# bit 0 = left, bit 1 = right, bit 2 = top, bit 3 = bottom.
+# Impossible combinations (e.g. left+right) resolve to None/arrow.
+_EDGE_TABLE = (
+    None, 'left', 'right', None,
+    'top', 'top-left', 'top-right', None,
+    'bottom', 'bottom-left', 'bottom-right', None,
+    None, None, None, None,
+)
+_CURSOR_TABLE = (
+    Qt.CursorShape.ArrowCursor,
+    Qt.CursorShape.SizeHorCursor,      # left
+    Qt.CursorShape.SizeHorCursor,      # right
+    Qt.CursorShape.ArrowCursor,
+    Qt.CursorShape.SizeVerCursor,      # top
+    Qt.CursorShape.SizeFDiagCursor,    # top-left
+    Qt.CursorShape.SizeBDiagCursor,    # top-right
+    Qt.CursorShape.ArrowCursor,
+    Qt.CursorShape.SizeVerCursor,      # bottom
+    Qt.CursorShape.SizeBDiagCursor,    # bottom-left
+    Qt.CursorShape.SizeFDiagCursor,    # bottom-right
+    Qt.CursorShape.ArrowCursor,
+    Qt.CursorShape.ArrowCursor,
+    Qt.CursorShape.ArrowCursor,
+    Qt.CursorShape.ArrowCursor,
+    Qt.CursorShape.ArrowCursor,
+)
+
+
+def _repolish(widget):
+    """Re-evaluate the global stylesheet after a dynamic property change.
+
+    Only the given widget is repolished — unlike setStyleSheet, which
+    reparses QSS and repolishes the whole subtree.
+    """
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+
+
+def _pointer_cursor():
+    global _POINTER_CURSOR
+    if _POINTER_CURSOR is None:
+        _POINTER_CURSOR = QCursor(Qt.CursorShape.PointingHandCursor)
+    return _POINTER_CURSOR
+
+
+def _open_url(url, checked=False):
+    # webbrowser is only needed once a link is clicked — keep it off the
+    # cold-start import path
+    import webbrowser
+    webbrowser.open(url)
+
+
+def _static_text_pixmap(text, pixel_size, color, device_pixel_ratio=1.0):
+    """Rasterize a static single-line text once so later repaints blit a
+    pixmap instead of re-shaping large glyphs through the text engine."""
+    font = QFont("Helvetica Neue")
+    font.setPixelSize(pixel_size)
+    font.setWeight(QFont.Weight.Bold)
+    metrics = QFontMetrics(font)
+    width = metrics.horizontalAdvance(text)
+    height = metrics.height()
+    pixmap = QPixmap(int(width * device_pixel_ratio), int(height * device_pixel_ratio))
+    pixmap.setDevicePixelRatio(device_pixel_ratio)
+    pixmap.fill(QColor(0, 0, 0, 0))
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+    painter.setFont(font)
+    painter.setPen(QPen(QColor(color)))
+    painter.drawText(0, metrics.ascent(), text)
+    painter.end()
+    return pixmap
+
+
+# Menu-bar triangle icon, painted once and reused
+_TRIANGLE_ICON = None
+
+
+def _triangle_icon():
+    global _TRIANGLE_ICON
+    if _TRIANGLE_ICON is None:
+        pixmap = QPixmap(22, 22)
+        pixmap.fill(QColor(0, 0, 0, 0))  # Transparent background
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setBrush(QBrush(QColor(COLOR_ACCENT)))
+        painter.setPen(QPen(Qt.PenStyle.NoPen))
+        triangle = QPolygon([QPoint(11, 3), QPoint(3, 19), QPoint(19, 19)])
+        painter.drawPolygon(triangle)
+        painter.end()
+        _TRIANGLE_ICON = QIcon(pixmap)
+    return _TRIANGLE_ICON
+
+
+# Preloaded system sound (AudioToolbox) so each save doesn't fork afplay
+_SOUND_ID = None
+_play_system_sound = None
+_DEVNULL_FD = None
+
 
 def play_notification_sound():
+    global _SOUND_ID, _play_system_sound, _DEVNULL_FD
+    if _play_system_sound is None:
+        try:
+            from AudioToolbox import AudioServicesCreateSystemSoundID, AudioServicesPlaySystemSound
+            from Foundation import NSURL
+            status, sound_id = AudioServicesCreateSystemSoundID(
+                NSURL.fileURLWithPath_(TIMER_SOUND_FILE), None
+            )
+            if status == 0:
+                _SOUND_ID = sound_id
+                _play_system_sound = AudioServicesPlaySystemSound
+        except (ImportError, AttributeError, OSError):
+            pass
+
+    if _play_system_sound is not None:
+        _play_system_sound(_SOUND_ID)
+        return
+
+    # Fallback when the AudioToolbox bindings aren't available — posix_spawn
+    # execs directly instead of fork()ing a copy of the large Qt process
     try:
-        subprocess.Popen(['afplay', TIMER_SOUND_FILE], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-    except:
+        if _DEVNULL_FD is None:
+            _DEVNULL_FD = os.open(os.devnull, os.O_WRONLY)
+        os.posix_spawn(
+            '/usr/bin/afplay', ['afplay', TIMER_SOUND_FILE], dict(os.environ),
+            file_actions=[
+                (os.POSIX_SPAWN_DUP2, _DEVNULL_FD, 1),
+                (os.POSIX_SPAWN_DUP2, _DEVNULL_FD, 2),
+            ],
+        )
+    except OSError:
         pass
 
 
+class _StartupTaskSignals(QObject):
+    finished = pyqtSignal(bool, bool)  # (success, enabled)
+
+
+class _StartupTask(QRunnable):
+    """Runs the launch-agent plist write + launchctl call off the GUI thread
+    (launchctl can take hundreds of ms and would freeze the UI)."""
+    def __init__(self, fn, enabled):
+        super().__init__()
+        self.fn = fn
+        self.enabled = enabled
+        self.signals = _StartupTaskSignals()
+
+    def run(self):
+        try:
+            self.fn()
+            self.signals.finished.emit(True, self.enabled)
+        except Exception as e:
+            print(f"Failed to update startup setting: {e}")
+            self.signals.finished.emit(False, self.enabled)
+
+
+# Opaque fill: the original 245/255 alpha forced read-modify-write blending
+# over the whole container for a barely visible see-through effect
+_GLASS_FILL = QColor(13, 13, 13)
+
+
 class GlassContainer(QWidget):
     """Rounded glass container widget"""
     def __init__(self, parent=None, radius=20):
         super().__init__(parent)
         self.radius = radius
+        # WA_TranslucentBackground stays: the rounded corners must clear
+        # to transparent, so WA_OpaquePaintEvent can't be claimed here
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
 
     def paintEvent(self, event):
         painter = QPainter(self)
+
+        # Fast path: when only interior content is dirty (e.g. the timer
+        # label ticking), a plain fill suffices — the antialiased rounded
+        # border only matters near the edges.
+        interior = self.rect().adjusted(self.radius + 1, self.radius + 1,
+                                        -(self.radius + 1), -(self.radius + 1))
+        if interior.contains(event.rect()):
+            painter.fillRect(event.rect(), _GLASS_FILL)
+            return
+
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
         # Draw rounded rectangle background
-        painter.setBrush(QBrush(QColor(13, 13, 13, 245)))
+        painter.setBrush(QBrush(_GLASS_FILL))
         painter.setPen(QPen(QColor(42, 42, 42), 1))
         painter.drawRoundedRect(self.rect(), self.radius, self.radius)
 
 
+class TimerDisplay(QWidget):
+    """Large MM:SS countdown readout painted from cached QStaticText runs.
+
+    QLabel.setText re-shapes and re-lays-out the 48px text on every tick;
+    QStaticText caches the shaped glyphs per character, so each second
+    only blits five pre-shaped runs. Non-countdown text ("PAUSED") falls
+    back to a single cached run.
+    """
+    def __init__(self, text="05:00", parent=None):
+        super().__init__(parent)
+        font = QFont("Helvetica Neue")
+        font.setPixelSize(48)
+        font.setBold(True)
+        self._font = font
+        self._color = QColor(COLOR_TEXT_PRIMARY)
+        self._glyphs = {}
+        for ch in "0123456789:":
+            st = QStaticText(ch)
+            st.setPerformanceHint(QStaticText.PerformanceHint.AggressiveCaching)
+            self._glyphs[ch] = st
+        fm = QFontMetrics(font)
+        self._digit_width = max(fm.horizontalAdvance(c) for c in "0123456789")
+        self._colon_width = fm.horizontalAdvance(":")
+        self._text = text
+        self._fallback = None
+        self.setFixedHeight(fm.height())
+
+    def setText(self, text):
+        if text == self._text:
+            return
+        self._text = text
+        if all(ch in self._glyphs for ch in text):
+            self._fallback = None
+        else:
+            st = QStaticText(text)
+            st.setPerformanceHint(QStaticText.PerformanceHint.AggressiveCaching)
+            self._fallback = st
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setFont(self._font)
+        painter.setPen(self._color)
+        if self._fallback is not None:
+            size = self._fallback.size()
+            painter.drawStaticText(int((self.width() - size.width()) / 2),
+                                   int((self.height() - size.height()) / 2),
+                                   self._fallback)
+            return
+        widths = [self._colon_width if ch == ":" else self._digit_width
+                  for ch in self._text]
+        x = (self.width() - sum(widths)) / 2
+        for ch, w in zip(self._text, widths):
+            glyph = self._glyphs[ch]
+            # Center each glyph in its fixed-width cell so digits don't
+            # shift horizontally as they change
+            painter.drawStaticText(int(x + (w - glyph.size().width()) / 2), 0, glyph)
+            x += w
+
+
 class CircleButton(QPushButton):
-    """macOS style circle button"""
-    def __init__(self, color, hover_color, parent=None):
+    """macOS style circle button (styled via _CIRCLE_BUTTON_QSS by object name)"""
+    def __init__(self, object_name, parent=None):
         super().__init__(parent)
-        self.color = color
-        self.hover_color = hover_color
+        self.setObjectName(object_name)
         self.setFixedSize(14, 14)
-        self.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
-        self.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {color};
-                border: none;
-                border-radius: 7px;
-            }}
-            QPushButton:hover {{
-                background-color: {hover_color};
-            }}
-        """)
+        self.setCursor(_pointer_cursor())
 
 
 class StyledButton(QPushButton):
     """Styled button with rounded corners"""
     def __init__(self, text, bg_color, text_color, hover_color, parent=None, border=False, border_color=None):
         super().__init__(text, parent)
-        self.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
+        self.setCursor(_pointer_cursor())
         border_style = f"border: 2px solid {border_color};" if border else "border: none;"
         self.setStyleSheet(f"""
             QPushButton {{
@@ -110,52 +541,33 @@ class StyledButton(QPushButton):
 
 
 class IntervalButton(QPushButton):
-    """Interval selection button"""
+    """Interval selection button.
+
+    Styled from the global sheet via the dynamic "selected" property, so
+    state changes only repolish this button instead of re-parsing QSS.
+    """
     def __init__(self, text, parent=None):
         super().__init__(text, parent)
-        self.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
+        self.setCursor(_pointer_cursor())
         self.setFixedSize(65, 30)
         self.selected = False
-        self.update_style()
-
-    def update_style(self):
-        if self.selected:
-            self.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {COLOR_ACCENT};
-                    color: black;
-                    border: none;
-                    border-radius: 15px;
-                    font-family: 'Helvetica Neue';
-                    font-size: 12px;
-                    font-weight: bold;
-                }}
-            """)
-        else:
-            self.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: transparent;
-                    color: {COLOR_TEXT_DIM};
-                    border: 1px solid #444444;
-                    border-radius: 15px;
-                    font-family: 'Helvetica Neue';
-                    font-size: 12px;
-                    font-weight: bold;
-                }}
-                QPushButton:hover {{
-                    background-color: #1a1a1a;
-                }}
-            """)
+        self.setProperty("selected", False)
 
     def set_selected(self, selected):
+        if selected == self.selected:
+            return
         self.selected = selected
-        self.update_style()
+        self.setProperty("selected", selected)
+        _repolish(self)
 
 
 class TriangleSaver(QMainWindow):
     def __init__(self):
         super().__init__()
 
+        # Shared stylesheet rules (parsed once for the whole app)
+        QApplication.instance().setStyleSheet(GLOBAL_QSS)
+
         # Window setup - frameless transparent, resizable
         self.setWindowFlags(Qt.WindowType.FramelessWindowHint | Qt.WindowType.WindowStaysOnTopHint)
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
@@ -163,15 +575,14 @@ class TriangleSaver(QMainWindow):
         self.setMaximumSize(520, 1050)
         self.setMouseTracking(True)  # Track mouse for resize cursors
 
-        # Center on screen
-        screen = QApplication.primaryScreen().geometry()
-        x = (screen.width() - WINDOW_WIDTH) // 2
-        y = (screen.height() - WINDOW_HEIGHT) // 2
-        self.move(x, y)
+        # Centered on first show (see showEvent) so the initial paint
+        # already happens at the final position
+        self._centered_once = False
 
         # Variables
         self.is_running = False
         self.interval_seconds = 300
+        self._stays_on_top = True
         self.next_save_time = 0
         self.is_pro_mode = False
         self.drag_position = None
@@ -180,15 +591,49 @@ class TriangleSaver(QMainWindow):
         self.base_width = WINDOW_WIDTH
         self.base_height = WINDOW_HEIGHT
         self.resize_edge = None
+        self.resize_start_pos = None
+        self.resize_start_geo = None
         self.resize_margin = 15  # Pixels from edge that trigger resize cursor
 
+        # Coalesce rescale work during interactive resizes to at most one
+        # transform rebuild per frame (~60Hz)
+        self._rescale_timer = QTimer(self)
+        self._rescale_timer.setSingleShot(True)
+        self._rescale_timer.setInterval(16)
+        self._rescale_timer.timeout.connect(self.update_scale)
+
+        # Coalesce interactive-resize geometry changes the same way:
+        # mouse moves arrive at hundreds of Hz, setGeometry applies at ~60
+        self._pending_geo = None
+        self._resize_throttle = QTimer(self)
+        self._resize_throttle.setSingleShot(True)
+        self._resize_throttle.setInterval(16)
+        self._resize_throttle.timeout.connect(self._apply_pending_geo)
+
         # Build UI
+        self.graphics_view = None  # set by setup_graphics_view below
         self.build_ui()
 
         # Wrap UI in QGraphicsView for proportional scaling
         self.setup_graphics_view()
 
+        # PyObjC bridge — keep the shared workspace around instead of
+        # fetching it in every helper
+        try:
+            self._ns_workspace = NSWorkspace.sharedWorkspace() if NSWorkspace else None
+        except AttributeError:
+            self._ns_workspace = None
+
+        # (timestamp, result) cache for is_ableton_running, plus the matching
+        # NSRunningApplication handle so perform_save can activate directly
+        self._ableton_cache = (0.0, False)
+        self._ableton_app = None
+
+        # Track the frontmost app via notifications instead of polling
+        self.watch_frontmost_app()
+
         # Sync startup toggle with actual plist state
+        self._startup_enabled_cache = None
         self.sync_startup_toggle()
 
         # Create menu bar (system tray) icon
@@ -201,12 +646,20 @@ class TriangleSaver(QMainWindow):
             Qt.Key.Key_T
         )
         self.global_monitor = None
+        self.local_monitor = None
         self.register_global_shortcut()
 
-        # Timer
+        # Timer (500ms tick is plenty for a seconds-granularity countdown).
+        # Started/stopped by toggle_running so the app makes zero wakeups
+        # while auto-save is idle.
+        self._last_remaining = None
+        self._paused_shown = False
         self.timer = QTimer()
+        # Coarse 1Hz tick: the display only shows whole seconds, and a
+        # coarse timer lets the OS coalesce wakeups (App Nap friendly)
+        self.timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self.timer.setInterval(1000)
         self.timer.timeout.connect(self.timer_loop)
-        self.timer.start(100)
 
     def build_ui(self):
         # Inner widget (will be embedded in QGraphicsView for scaling)
@@ -218,23 +671,32 @@ class TriangleSaver(QMainWindow):
         layout = QVBoxLayout(self.inner_widget)
         layout.setContentsMargins(10, 10, 10, 10)
 
+        # Widget groups toggled by timer mode (cached so toggle_timer_mode
+        # doesn't have to walk the widget tree with findChildren)
+        self._social_buttons = []
+        self._hideable_frames = []
+        self._settings_rows = []
+
         # Glass container
         self.container = GlassContainer(radius=CORNER_RADIUS)
         container_layout = QVBoxLayout(self.container)
         container_layout.setContentsMargins(20, 15, 20, 15)
-        container_layout.setSpacing(5)
+        # Uniform spacing instead of per-section addSpacing spacer items:
+        # fewer layout items makes QLayout::activate cheaper on every
+        # show/hide in timer mode
+        container_layout.setSpacing(8)
 
         # --- Title Bar ---
         title_bar = QHBoxLayout()
         title_bar.setSpacing(8)
 
-        self.btn_close = CircleButton(COLOR_DANGER, "#FF7B75")
+        self.btn_close = CircleButton("btnClose")
         self.btn_close.clicked.connect(self.close_app)
 
-        self.btn_minimize = CircleButton(COLOR_YELLOW, "#FFD062")
+        self.btn_minimize = CircleButton("btnMinimize")
         self.btn_minimize.clicked.connect(self.showMinimized)
 
-        self.btn_timer_mode = CircleButton(COLOR_GREEN, "#4AE567")
+        self.btn_timer_mode = CircleButton("btnTimerMode")
         self.btn_timer_mode.clicked.connect(self.toggle_timer_mode)
 
         title_bar.addWidget(self.btn_close)
@@ -245,32 +707,34 @@ class TriangleSaver(QMainWindow):
         container_layout.addLayout(title_bar)
 
         # --- Header ---
-        self.lbl_brand = QLabel("TRIANGLE")
+        self.lbl_brand = QLabel()
         self.lbl_brand.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.lbl_brand.setStyleSheet(f"color: {COLOR_TEXT_PRIMARY}; font-family: 'Helvetica Neue'; font-size: 48px; font-weight: bold;")
+        # The brand wordmark never changes — blit a pre-rendered pixmap
+        # instead of shaping 48px bold glyphs on every repaint
+        self.lbl_brand.setPixmap(_static_text_pixmap(
+            "TRIANGLE", 48, COLOR_TEXT_PRIMARY,
+            self.devicePixelRatioF()
+        ))
         container_layout.addWidget(self.lbl_brand)
 
         self.lbl_subtitle = QLabel("Ableton Auto Saver")
         self.lbl_subtitle.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.lbl_subtitle.setStyleSheet(f"color: {COLOR_TEXT_SECONDARY}; font-family: 'Helvetica Neue'; font-size: 18px;")
+        self.lbl_subtitle.setObjectName("subtitle")
         container_layout.addWidget(self.lbl_subtitle)
 
         self.lbl_desc = QLabel("Professional Auto-Save Tool\nfor Ableton Live.")
         self.lbl_desc.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.lbl_desc.setStyleSheet(f"color: {COLOR_TEXT_DIM}; font-family: 'Helvetica Neue'; font-size: 13px;")
+        self.lbl_desc.setObjectName("desc")
         container_layout.addWidget(self.lbl_desc)
 
-        container_layout.addSpacing(10)
 
         # --- Timer ---
-        self.lbl_timer = QLabel("05:00")
-        self.lbl_timer.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.lbl_timer.setStyleSheet(f"color: {COLOR_TEXT_PRIMARY}; font-family: 'Helvetica Neue'; font-size: 48px; font-weight: bold;")
+        self.lbl_timer = TimerDisplay("05:00")
         container_layout.addWidget(self.lbl_timer)
 
         self.lbl_timer_desc = QLabel("NEXT SAVE CYCLE")
         self.lbl_timer_desc.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.lbl_timer_desc.setStyleSheet(f"color: {COLOR_ACCENT}; font-family: 'Helvetica Neue'; font-size: 10px;")
+        self.lbl_timer_desc.setObjectName("timerDesc")
         container_layout.addWidget(self.lbl_timer_desc)
 
         self.lbl_last_saved = QLabel("Waiting to start...")
@@ -278,7 +742,6 @@ class TriangleSaver(QMainWindow):
         self.lbl_last_saved.setStyleSheet(f"color: {COLOR_TEXT_DIM}; font-family: 'Helvetica Neue'; font-size: 10px;")
         container_layout.addWidget(self.lbl_last_saved)
 
-        container_layout.addSpacing(10)
 
         # --- Interval Buttons ---
         interval_layout = QHBoxLayout()
@@ -290,7 +753,8 @@ class TriangleSaver(QMainWindow):
 
         for text, seconds in intervals:
             btn = IntervalButton(text)
-            btn.clicked.connect(lambda checked, s=seconds, b=btn: self.set_interval(s, b))
+            btn.seconds = seconds
+            btn.clicked.connect(self._on_interval_clicked)
             self.interval_buttons.append((btn, seconds))
             interval_layout.addWidget(btn)
 
@@ -299,22 +763,16 @@ class TriangleSaver(QMainWindow):
 
         container_layout.addLayout(interval_layout)
 
-        container_layout.addSpacing(10)
 
         # --- Custom Interval ---
         self.lbl_custom = QLabel("CUSTOM INTERVAL")
         self.lbl_custom.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.lbl_custom.setStyleSheet(f"color: {COLOR_TEXT_DIM}; font-family: 'Helvetica Neue'; font-size: 10px;")
+        self.lbl_custom.setObjectName("sectionLabel")
         container_layout.addWidget(self.lbl_custom)
 
         custom_frame = QFrame()
-        custom_frame.setStyleSheet(f"""
-            QFrame {{
-                background-color: {COLOR_BG_SECONDARY};
-                border: 1px solid #333333;
-                border-radius: 18px;
-            }}
-        """)
+        custom_frame.setObjectName("customFrame")
+        self._hideable_frames.append(custom_frame)
         custom_layout = QHBoxLayout(custom_frame)
         custom_layout.setContentsMargins(15, 10, 15, 10)
 
@@ -322,48 +780,26 @@ class TriangleSaver(QMainWindow):
         self.entry_custom.setPlaceholderText("00")
         self.entry_custom.setFixedSize(55, 32)
         self.entry_custom.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.entry_custom.setStyleSheet(f"""
-            QLineEdit {{
-                background-color: #0a0a0a;
-                color: {COLOR_TEXT_PRIMARY};
-                border: 1px solid #333333;
-                border-radius: 16px;
-                padding: 5px;
-                font-family: 'Helvetica Neue';
-                font-weight: bold;
-                font-size: 12px;
-            }}
-        """)
+        self.entry_custom.setObjectName("customEntry")
 
         self.btn_sec = QPushButton("SEC")
         self.btn_min = QPushButton("MIN")
+        self.btn_sec.setObjectName("unitBtn")
+        self.btn_min.setObjectName("unitBtn")
         self.time_unit = "MIN"
 
         for btn in [self.btn_sec, self.btn_min]:
             btn.setFixedSize(50, 30)
-            btn.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
+            btn.setCursor(_pointer_cursor())
 
-        self.btn_sec.clicked.connect(lambda: self.set_time_unit("SEC"))
-        self.btn_min.clicked.connect(lambda: self.set_time_unit("MIN"))
+        self.btn_sec.clicked.connect(partial(self.set_time_unit, "SEC"))
+        self.btn_min.clicked.connect(partial(self.set_time_unit, "MIN"))
         self.update_time_unit_buttons()
 
         self.btn_set = QPushButton("SET")
         self.btn_set.setFixedSize(60, 30)
-        self.btn_set.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
-        self.btn_set.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {COLOR_ACCENT};
-                color: black;
-                border: none;
-                border-radius: 15px;
-                font-family: 'Helvetica Neue';
-                font-size: 11px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background-color: #E2FF4D;
-            }}
-        """)
+        self.btn_set.setCursor(_pointer_cursor())
+        self.btn_set.setObjectName("btnSet")
         self.btn_set.clicked.connect(self.set_custom_interval)
 
         custom_layout.addWidget(self.entry_custom)
@@ -375,15 +811,16 @@ class TriangleSaver(QMainWindow):
 
         container_layout.addWidget(custom_frame)
 
-        container_layout.addSpacing(15)
 
         # --- Main Action Button ---
-        self.btn_toggle = StyledButton("START AUTO-SAVE", COLOR_ACCENT, "black", "#E2FF4D")
+        self.btn_toggle = QPushButton("START AUTO-SAVE")
+        self.btn_toggle.setObjectName("toggleBtn")
+        self.btn_toggle.setCursor(_pointer_cursor())
+        self.btn_toggle.setProperty("running", False)
         self.btn_toggle.setFixedHeight(45)
         self.btn_toggle.clicked.connect(self.toggle_running)
         container_layout.addWidget(self.btn_toggle)
 
-        container_layout.addSpacing(10)
 
         # --- Timer Mode Button ---
         self.btn_timer_only = StyledButton("TIMER MODE", "transparent", COLOR_ACCENT, "#1a1a1a", border=True, border_color=COLOR_ACCENT)
@@ -404,7 +841,6 @@ class TriangleSaver(QMainWindow):
         back_btn_layout.addWidget(self.btn_back_main)
         container_layout.addLayout(back_btn_layout)
 
-        container_layout.addSpacing(10)
 
         # --- Switches/Settings ---
         self.switches = {}
@@ -415,58 +851,20 @@ class TriangleSaver(QMainWindow):
         ]
 
         for text, key, default_on in settings:
-            row = QHBoxLayout()
-            row.setSpacing(10)
-
-            # Toggle switch container
-            switch_container = QWidget()
-            switch_container.setFixedSize(50, 26)
-            switch_layout = QHBoxLayout(switch_container)
-            switch_layout.setContentsMargins(0, 0, 0, 0)
-
-            switch = QPushButton()
-            switch.setCheckable(True)
-            switch.setChecked(default_on)
-            switch.setFixedSize(50, 26)
-            switch.setProperty("key", key)
-            switch.clicked.connect(lambda checked, s=switch, k=key: self.toggle_setting(s, k))
-            self.update_switch_style(switch)
-            self.switches[key] = switch
-
-            switch_layout.addWidget(switch)
-
-            label = QLabel(text)
-            label.setStyleSheet(f"color: {COLOR_TEXT_SECONDARY}; font-family: 'Helvetica Neue'; font-size: 12px;")
-
-            row.addWidget(switch_container)
-            row.addWidget(label)
-            row.addStretch()
-            container_layout.addLayout(row)
+            container_layout.addWidget(self._build_switch_row(text, key, default_on))
 
         # --- Keyboard Shortcut Setting ---
         shortcut_row = QHBoxLayout()
         shortcut_row.setSpacing(10)
 
         shortcut_label = QLabel("Toggle Shortcut")
-        shortcut_label.setStyleSheet(f"color: {COLOR_TEXT_SECONDARY}; font-family: 'Helvetica Neue'; font-size: 12px;")
+        shortcut_label.setObjectName("settingLabel")
 
         self.shortcut_input = QPushButton("Ctrl+Shift+T")
         self.shortcut_input.setFixedSize(130, 28)
-        self.shortcut_input.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
-        self.shortcut_input.setStyleSheet(f"""
-            QPushButton {{
-                background-color: #0a0a0a;
-                color: {COLOR_ACCENT};
-                border: 1px solid #333333;
-                border-radius: 14px;
-                font-family: 'Helvetica Neue';
-                font-size: 11px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                border-color: {COLOR_ACCENT};
-            }}
-        """)
+        self.shortcut_input.setObjectName("shortcutInput")
+        self.shortcut_input.setCursor(_pointer_cursor())
+        self.shortcut_input.setProperty("recording", False)
         self.shortcut_input.clicked.connect(self.start_shortcut_recording)
 
         shortcut_row.addWidget(shortcut_label)
@@ -474,31 +872,27 @@ class TriangleSaver(QMainWindow):
         shortcut_row.addWidget(self.shortcut_input)
         container_layout.addLayout(shortcut_row)
 
-        container_layout.addSpacing(10)
 
         # --- Separator ---
         separator = QFrame()
         separator.setFixedHeight(1)
-        separator.setStyleSheet(f"background-color: #222222;")
+        separator.setObjectName("separator")
+        self._hideable_frames.append(separator)
         container_layout.addWidget(separator)
 
-        container_layout.addSpacing(10)
 
         # --- Social Links ---
         social_layout = QHBoxLayout()
         social_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
         social_layout.setSpacing(10)
 
-        btn_discord = StyledButton("Join Discord", "#5865F2", "white", "#7289da")
-        btn_discord.setFixedSize(125, 32)
-        btn_discord.clicked.connect(lambda: webbrowser.open(TRIANGLE_DISCORD_URL))
-
-        btn_whatsapp = StyledButton("Join WhatsApp", "#25D366", "white", "#4CE77F")
-        btn_whatsapp.setFixedSize(125, 32)
-        btn_whatsapp.clicked.connect(lambda: webbrowser.open(TRIANGLE_WHATSAPP_URL))
+        for text, url, bg, fg, hover in SOCIAL_BUTTONS:
+            btn = StyledButton(text, bg, fg, hover)
+            btn.setFixedSize(125, 32)
+            btn.clicked.connect(partial(_open_url, url))
+            social_layout.addWidget(btn)
+            self._social_buttons.append(btn)
 
-        social_layout.addWidget(btn_discord)
-        social_layout.addWidget(btn_whatsapp)
         container_layout.addLayout(social_layout)
 
         # --- Instagram Links ---
@@ -506,46 +900,15 @@ class TriangleSaver(QMainWindow):
         insta_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
         insta_layout.setSpacing(10)
 
-        btn_ido = QPushButton("@ido_triangle")
-        btn_ido.setFixedSize(120, 30)
-        btn_ido.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
-        btn_ido.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                color: {COLOR_ACCENT};
-                border: 2px solid {COLOR_ACCENT};
-                border-radius: 15px;
-                font-family: 'Helvetica Neue';
-                font-size: 11px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background-color: rgba(212, 255, 0, 0.1);
-            }}
-        """)
-        btn_ido.clicked.connect(lambda: webbrowser.open(INSTA_IDO_URL))
-
-        btn_amit = QPushButton("@amit.triangle")
-        btn_amit.setFixedSize(120, 30)
-        btn_amit.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
-        btn_amit.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                color: {COLOR_ACCENT};
-                border: 2px solid {COLOR_ACCENT};
-                border-radius: 15px;
-                font-family: 'Helvetica Neue';
-                font-size: 11px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background-color: rgba(212, 255, 0, 0.1);
-            }}
-        """)
-        btn_amit.clicked.connect(lambda: webbrowser.open(INSTA_AMIT_URL))
+        for text, url in INSTA_BUTTONS:
+            btn = QPushButton(text)
+            btn.setObjectName("linkBtn")
+            btn.setFixedSize(120, 30)
+            btn.setCursor(_pointer_cursor())
+            btn.clicked.connect(partial(_open_url, url))
+            insta_layout.addWidget(btn)
+            self._social_buttons.append(btn)
 
-        insta_layout.addWidget(btn_ido)
-        insta_layout.addWidget(btn_amit)
         container_layout.addLayout(insta_layout)
 
         container_layout.addStretch()
@@ -553,11 +916,41 @@ class TriangleSaver(QMainWindow):
         # --- Footer ---
         self.lbl_footer = QLabel("V6.0 Official")
         self.lbl_footer.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.lbl_footer.setStyleSheet(f"color: #444444; font-family: 'Helvetica Neue'; font-size: 10px;")
+        self.lbl_footer.setObjectName("footer")
         container_layout.addWidget(self.lbl_footer)
 
         layout.addWidget(self.container)
 
+    def _build_switch_row(self, text, key, default_on):
+        """Build one settings row (switch + label) as a single widget.
+
+        The switch no longer sits in its own container widget/layout, and
+        hiding the row in timer mode now takes the label with it.
+        """
+        row = QWidget()
+        row_layout = QHBoxLayout(row)
+        row_layout.setContentsMargins(0, 0, 0, 0)
+        row_layout.setSpacing(10)
+
+        switch = QPushButton()
+        switch.setObjectName("switch")
+        switch.setCheckable(True)
+        switch.setChecked(default_on)
+        switch.setFixedSize(50, 26)
+        switch.setProperty("key", key)
+        switch.clicked.connect(partial(self.toggle_setting, switch, key))
+        self.update_switch_style(switch)
+        self.switches[key] = switch
+
+        label = QLabel(text)
+        label.setObjectName("settingLabel")
+
+        row_layout.addWidget(switch)
+        row_layout.addWidget(label)
+        row_layout.addStretch()
+        self._settings_rows.append(row)
+        return row
+
     def setup_graphics_view(self):
         """Embed the inner UI widget in a QGraphicsView for proportional scaling."""
         self.scene = QGraphicsScene(self)
@@ -566,6 +959,10 @@ class TriangleSaver(QMainWindow):
         self.graphics_view = QGraphicsView(self.scene, self)
         self.graphics_view.setRenderHint(QPainter.RenderHint.Antialiasing)
         self.graphics_view.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        # The scene holds exactly one proxy widget, so BSP indexing and
+        # per-item painter-state saves are pure overhead
+        self.scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
+        self.graphics_view.setOptimizationFlag(QGraphicsView.OptimizationFlag.DontSavePainterState)
         self.graphics_view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.graphics_view.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.graphics_view.setFrameStyle(0)
@@ -584,7 +981,7 @@ class TriangleSaver(QMainWindow):
 
     def update_scale(self):
         """Scale the UI proportionally to fit the current window size."""
-        if not hasattr(self, 'graphics_view'):
+        if self.graphics_view is None:
             return
         view_width = self.graphics_view.viewport().width()
         view_height = self.graphics_view.viewport().height()
@@ -595,60 +992,36 @@ class TriangleSaver(QMainWindow):
         scale_y = view_height / self.base_height
         scale = min(scale_x, scale_y)
 
-        from PyQt6.QtGui import QTransform
         transform = QTransform()
         transform.scale(scale, scale)
         self.graphics_view.setTransform(transform)
         self.graphics_view.centerOn(self.proxy_widget)
 
     def update_switch_style(self, switch):
-        if switch.isChecked():
-            # ON state - accent color with circle on right
-            switch.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {COLOR_ACCENT};
-                    border: none;
-                    border-radius: 13px;
-                    text-align: right;
-                    padding-right: 3px;
-                }}
-                QPushButton::before {{
-                    content: '';
-                }}
-            """)
-            switch.setText("  ●")
-        else:
-            # OFF state - gray with circle on left
-            switch.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: #333333;
-                    border: none;
-                    border-radius: 13px;
-                    text-align: left;
-                    padding-left: 3px;
-                    color: white;
-                }}
-            """)
-            switch.setText("●  ")
+        # Colors/alignment come from the :checked rules in the global sheet;
+        # only the knob glyph position needs updating here
+        switch.setText("  ●" if switch.isChecked() else "●  ")
 
     # --- System Tray / Menu Bar ---
     def create_tray_icon(self):
         """Create the macOS menu bar (system tray) icon with a triangle logo."""
-        # Generate a triangle icon programmatically (no external file needed)
-        pixmap = QPixmap(22, 22)
-        pixmap.fill(QColor(0, 0, 0, 0))  # Transparent background
-        painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        painter.setBrush(QBrush(QColor(COLOR_ACCENT)))
-        painter.setPen(QPen(Qt.PenStyle.NoPen))
-        triangle = QPolygon([QPoint(11, 3), QPoint(3, 19), QPoint(19, 19)])
-        painter.drawPolygon(triangle)
-        painter.end()
+        # Icon is generated programmatically (no external file needed) and
+        # cached at module level
+        self.tray_icon = QSystemTrayIcon(_triangle_icon(), self)
+        self.tray_icon.setToolTip("Triangle Ableton Auto Saver")
+        self.tray_icon.activated.connect(self.tray_icon_activated)
+        self.tray_icon.show()
 
-        icon = QIcon(pixmap)
-        self.tray_icon = QSystemTrayIcon(icon, self)
+        # Defer menu construction until the event loop is running — macOS
+        # shows the menu on click with no request signal, so it must be
+        # attached before first use, but it doesn't need to block cold start
+        self.tray_menu = None
+        self.action_show_hide = None
+        QTimer.singleShot(0, self._build_tray_menu)
 
-        # Build the context menu
+    def _build_tray_menu(self):
+        if self.tray_menu is not None:
+            return
         tray_menu = QMenu()
         self.action_show_hide = QAction("Hide Window", self)
         self.action_show_hide.triggered.connect(self.toggle_window_visibility)
@@ -660,21 +1033,24 @@ class TriangleSaver(QMainWindow):
         action_quit.triggered.connect(self.quit_app)
         tray_menu.addAction(action_quit)
 
+        self.tray_menu = tray_menu
         self.tray_icon.setContextMenu(tray_menu)
-        self.tray_icon.setToolTip("Triangle Ableton Auto Saver")
-        self.tray_icon.activated.connect(self.tray_icon_activated)
-        self.tray_icon.show()
 
+    def _set_show_hide_text(self, text):
+        if self.action_show_hide is not None:
+            self.action_show_hide.setText(text)
+
+    @pyqtSlot()
     def toggle_window_visibility(self):
         """Show the window if hidden, hide if visible."""
         if self.isVisible():
             self.hide()
-            self.action_show_hide.setText("Show Window")
+            self._set_show_hide_text("Show Window")
         else:
             self.show()
             self.raise_()
             self.activateWindow()
-            self.action_show_hide.setText("Hide Window")
+            self._set_show_hide_text("Hide Window")
 
     def tray_icon_activated(self, reason):
         """Handle tray icon clicks — toggle window on click."""
@@ -683,13 +1059,7 @@ class TriangleSaver(QMainWindow):
 
     def quit_app(self):
         """Fully quit the application. Only accessible from the tray menu."""
-        # Remove global hotkey monitor
-        if hasattr(self, 'global_monitor') and self.global_monitor:
-            try:
-                from AppKit import NSEvent
-                NSEvent.removeMonitor_(self.global_monitor)
-            except:
-                pass
+        self._remove_shortcut_monitors()
         self.tray_icon.hide()
         QApplication.instance().quit()
 
@@ -699,7 +1069,7 @@ class TriangleSaver(QMainWindow):
         """
         event.ignore()
         self.hide()
-        self.action_show_hide.setText("Show Window")
+        self._set_show_hide_text("Show Window")
 
     def sync_startup_toggle(self):
         """Sync the startup toggle to match whether the plist actually exists."""
@@ -714,11 +1084,18 @@ class TriangleSaver(QMainWindow):
         return os.path.expanduser("~/Library/LaunchAgents/com.triangle.abletonsaver.plist")
 
     def is_startup_enabled(self):
-        """Check if the launch agent plist exists."""
-        return os.path.exists(self.get_plist_path())
+        """Check if the launch agent plist exists (cached — only this app
+        creates or removes it, so the answer can't change behind our back)."""
+        if self._startup_enabled_cache is None:
+            self._startup_enabled_cache = os.path.exists(self.get_plist_path())
+        return self._startup_enabled_cache
 
     def enable_launch_on_startup(self):
-        """Create a macOS Launch Agent plist so the app runs at login."""
+        """Create a macOS Launch Agent plist so the app runs at login.
+
+        Runs on a worker thread via _StartupTask; raises on failure so the
+        task can report it and the toggle can be reverted.
+        """
         plist_path = self.get_plist_path()
         python_path = sys.executable  # Use the Python that's running this script
         script_path = os.path.abspath(__file__)
@@ -743,56 +1120,82 @@ class TriangleSaver(QMainWindow):
 </dict>
 </plist>
 """
-        try:
-            os.makedirs(os.path.dirname(plist_path), exist_ok=True)
-            with open(plist_path, "w") as f:
-                f.write(plist_content)
-            subprocess.run(["launchctl", "load", plist_path], check=True)
-        except Exception as e:
-            print(f"Failed to enable startup: {e}")
+        os.makedirs(os.path.dirname(plist_path), exist_ok=True)
+        with open(plist_path, "w") as f:
+            f.write(plist_content)
+        subprocess.run(["launchctl", "load", plist_path], check=True)
+        self._startup_enabled_cache = True
 
     def disable_launch_on_startup(self):
-        """Remove the macOS Launch Agent plist to stop running at login."""
+        """Remove the macOS Launch Agent plist to stop running at login.
+
+        Runs on a worker thread via _StartupTask, like
+        enable_launch_on_startup.
+        """
         plist_path = self.get_plist_path()
-        try:
-            if os.path.exists(plist_path):
-                subprocess.run(["launchctl", "unload", plist_path], stderr=subprocess.DEVNULL)
-                os.remove(plist_path)
-        except Exception as e:
-            print(f"Failed to disable startup: {e}")
+        if os.path.exists(plist_path):
+            subprocess.run(["launchctl", "unload", plist_path], stderr=subprocess.DEVNULL)
+            os.remove(plist_path)
+        self._startup_enabled_cache = False
 
-    def toggle_setting(self, switch, key):
+    def toggle_setting(self, switch, key, checked=False):
         checked = switch.isChecked()
         self.update_switch_style(switch)
 
         if key == "top":
-            if checked:
-                self.setWindowFlags(self.windowFlags() | Qt.WindowType.WindowStaysOnTopHint)
+            if checked == self._stays_on_top:
+                return
+            self._stays_on_top = checked
+            handle = self.windowHandle()
+            if handle is not None:
+                # Qt 6: flip the hint on the QWindow — updates the native
+                # attribute without the full window recreate (and repaint
+                # cascade) that widget-level setWindowFlags causes
+                handle.setFlag(Qt.WindowType.WindowStaysOnTopHint, checked)
             else:
-                self.setWindowFlags(self.windowFlags() & ~Qt.WindowType.WindowStaysOnTopHint)
-            self.show()
+                # No native window yet — fall back to the widget-level path
+                was_visible = self.isVisible()
+                if checked:
+                    self.setWindowFlags(self.windowFlags() | Qt.WindowType.WindowStaysOnTopHint)
+                else:
+                    self.setWindowFlags(self.windowFlags() & ~Qt.WindowType.WindowStaysOnTopHint)
+                if was_visible:
+                    self.show()
         elif key == "pro":
             self.is_pro_mode = checked
         elif key == "startup":
-            if checked:
-                self.enable_launch_on_startup()
-            else:
-                self.disable_launch_on_startup()
+            # launchctl can take hundreds of ms — run it off the GUI thread.
+            # The switch already shows the new state; revert it if the task fails.
+            fn = self.enable_launch_on_startup if checked else self.disable_launch_on_startup
+            task = _StartupTask(fn, checked)
+            task.signals.finished.connect(self._on_startup_task_done)
+            QThreadPool.globalInstance().start(task)
+
+    def _on_startup_task_done(self, success, enabled):
+        if success:
+            return
+        # Revert the optimistic toggle
+        self._startup_enabled_cache = not enabled
+        switch = self.switches.get("startup")
+        if switch is not None:
+            switch.setChecked(not enabled)
+            self.update_switch_style(switch)
 
     def toggle_timer_mode(self):
         self.is_timer_mode = not self.is_timer_mode
 
+        # Coalesce the ~20 hide/show relayouts below into a single repaint
+        self.setUpdatesEnabled(False)
+
         # Widgets to hide in timer mode
         widgets_to_hide = [
             self.lbl_brand, self.lbl_subtitle, self.lbl_desc,
             self.lbl_custom, self.btn_timer_only, self.lbl_footer
         ]
 
-        # Find the custom frame and interval buttons container
-        # Hide/show frames
-        for widget in self.findChildren(QFrame):
-            if widget != self.container:
-                widget.setVisible(not self.is_timer_mode)
+        # Hide/show frames (cached at build time)
+        for frame in self._hideable_frames:
+            frame.setVisible(not self.is_timer_mode)
 
         if self.is_timer_mode:
             # Enter timer mode - compact view
@@ -804,25 +1207,26 @@ class TriangleSaver(QMainWindow):
                 btn.hide()
 
             # Hide settings rows
-            for key, switch in self.switches.items():
-                switch.parentWidget().hide()
+            for row in self._settings_rows:
+                row.hide()
 
-            # Hide social buttons - find by traversing
-            for btn in self.findChildren(QPushButton):
-                text = btn.text()
-                if text in ["Join Discord", "Join WhatsApp", "@ido_triangle", "@amit.triangle"]:
-                    btn.hide()
+            # Hide social buttons
+            for btn in self._social_buttons:
+                btn.hide()
 
             # Show back button
             self.btn_back_main.show()
 
             # Resize window to compact
             self.base_height = 320
-            self.inner_widget.setFixedSize(WINDOW_WIDTH, 320)
             self.setMinimumSize(320, 280)
             self.setMaximumSize(520, 420)
-            self.resize(WINDOW_WIDTH, 320)
-            QTimer.singleShot(50, self.update_scale)
+            # Both size calls trigger full layout passes — skip when the
+            # inner widget is already at the target height
+            if self.inner_widget.height() != 320:
+                self.inner_widget.setFixedSize(WINDOW_WIDTH, 320)
+                self.resize(WINDOW_WIDTH, 320)
+                QTimer.singleShot(50, self.update_scale)
 
         else:
             # Exit timer mode - full view
@@ -834,60 +1238,46 @@ class TriangleSaver(QMainWindow):
                 btn.show()
 
             # Show settings rows
-            for key, switch in self.switches.items():
-                switch.parentWidget().show()
+            for row in self._settings_rows:
+                row.show()
 
             # Show social buttons
-            for btn in self.findChildren(QPushButton):
-                text = btn.text()
-                if text in ["Join Discord", "Join WhatsApp", "@ido_triangle", "@amit.triangle"]:
-                    btn.show()
+            for btn in self._social_buttons:
+                btn.show()
 
             # Hide back button
             self.btn_back_main.hide()
 
             # Restore window size
             self.base_height = WINDOW_HEIGHT
-            self.inner_widget.setFixedSize(WINDOW_WIDTH, WINDOW_HEIGHT)
             self.setMinimumSize(320, 650)
             self.setMaximumSize(520, 1050)
-            self.resize(WINDOW_WIDTH, WINDOW_HEIGHT)
-            QTimer.singleShot(50, self.update_scale)
+            if self.inner_widget.height() != WINDOW_HEIGHT:
+                self.inner_widget.setFixedSize(WINDOW_WIDTH, WINDOW_HEIGHT)
+                self.resize(WINDOW_WIDTH, WINDOW_HEIGHT)
+                QTimer.singleShot(50, self.update_scale)
 
-    def set_time_unit(self, unit):
+        self.setUpdatesEnabled(True)
+        self.update()
+
+    def set_time_unit(self, unit, checked=False):
+        # checked absorbs the bool emitted by QPushButton.clicked
         self.time_unit = unit
         self.update_time_unit_buttons()
 
     def update_time_unit_buttons(self):
         for btn, unit in [(self.btn_sec, "SEC"), (self.btn_min, "MIN")]:
-            if self.time_unit == unit:
-                btn.setStyleSheet(f"""
-                    QPushButton {{
-                        background-color: {COLOR_ACCENT};
-                        color: black;
-                        border: none;
-                        border-radius: 8px;
-                        font-family: 'Helvetica Neue';
-                        font-size: 10px;
-                        font-weight: bold;
-                    }}
-                """)
-            else:
-                btn.setStyleSheet(f"""
-                    QPushButton {{
-                        background-color: #222222;
-                        color: {COLOR_TEXT_DIM};
-                        border: none;
-                        border-radius: 8px;
-                        font-family: 'Helvetica Neue';
-                        font-size: 10px;
-                    }}
-                    QPushButton:hover {{
-                        background-color: #333333;
-                    }}
-                """)
-
-    def set_interval(self, seconds, clicked_btn):
+            selected = self.time_unit == unit
+            if btn.property("selected") != selected:
+                btn.setProperty("selected", selected)
+                _repolish(btn)
+
+    def _on_interval_clicked(self):
+        btn = self.sender()
+        self.set_interval(btn.seconds, btn)
+
+    def set_interval(self, seconds, clicked_btn, checked=False):
+        # checked absorbs the bool emitted by QPushButton.clicked
         self.interval_seconds = seconds
         for btn, _ in self.interval_buttons:
             btn.set_selected(btn == clicked_btn)
@@ -901,121 +1291,131 @@ class TriangleSaver(QMainWindow):
             for btn, _ in self.interval_buttons:
                 btn.set_selected(False)
             self.update_timer_display(seconds)
-        except:
+        except ValueError:
             pass
 
     def update_timer_display(self, seconds):
-        mins, secs = divmod(seconds, 60)
-        self.lbl_timer.setText(f"{mins:02d}:{secs:02d}")
+        # %-formatting is measurably faster than f-strings for this
+        self.lbl_timer.setText("%02d:%02d" % divmod(seconds, 60))
 
     def toggle_running(self):
         self.is_running = not self.is_running
+        self.btn_toggle.setProperty("running", self.is_running)
+        _repolish(self.btn_toggle)
         if self.is_running:
-            self.btn_toggle.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {COLOR_DANGER};
-                    color: white;
-                    border: none;
-                    border-radius: 18px;
-                    padding: 10px 20px;
-                    font-family: 'Helvetica Neue';
-                    font-size: 13px;
-                    font-weight: bold;
-                }}
-                QPushButton:hover {{
-                    background-color: #FF7B75;
-                }}
-            """)
             self.btn_toggle.setText("STOP AUTO-SAVE")
-            self.next_save_time = time.time() + self.interval_seconds
+            self.next_save_time = time.monotonic() + self.interval_seconds
+            self._last_remaining = None
+            self._paused_shown = False
             self.lbl_timer_desc.setText("MONITORING ABLETON...")
+            self.timer.start()
         else:
-            self.btn_toggle.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {COLOR_ACCENT};
-                    color: black;
-                    border: none;
-                    border-radius: 18px;
-                    padding: 10px 20px;
-                    font-family: 'Helvetica Neue';
-                    font-size: 13px;
-                    font-weight: bold;
-                }}
-                QPushButton:hover {{
-                    background-color: #E2FF4D;
-                }}
-            """)
             self.btn_toggle.setText("START AUTO-SAVE")
             self.lbl_timer_desc.setText("NEXT SAVE CYCLE")
+            self.timer.stop()
             self.update_timer_display(self.interval_seconds)
 
     def timer_loop(self):
-        if self.is_running:
-            remaining = int(self.next_save_time - time.time())
-            if remaining <= 0:
-                if self.is_ableton_running():
-                    self.perform_save()
-                    self.next_save_time = time.time() + self.interval_seconds
-                    play_notification_sound()
-                else:
-                    self.lbl_timer.setText("PAUSED")
-                    self.lbl_timer_desc.setText("Open Ableton to resume")
-            else:
-                self.update_timer_display(remaining)
+        # Only ever invoked while running — toggle_running stops the timer
+        now = time.monotonic()
+        remaining = int(self.next_save_time - now)
+        if remaining <= 0:
+            if self.is_ableton_running():
+                self.perform_save()
+                self.next_save_time = now + self.interval_seconds
+                self._last_remaining = None
+                self._paused_shown = False
+                play_notification_sound()
+            elif not self._paused_shown:
+                # Set the PAUSED labels once, not on every tick
+                self._paused_shown = True
+                self.lbl_timer.setText("PAUSED")
+                self.lbl_timer_desc.setText("Open Ableton to resume")
+        else:
+            # Skip label work entirely while hidden in the tray; showEvent
+            # resets _last_remaining so the display catches up on show
+            if not self.isVisible():
+                return
+            # Only repaint when the displayed seconds value actually changed
+            if remaining == self._last_remaining:
+                return
+            self._last_remaining = remaining
+            self.update_timer_display(remaining)
 
-    def is_ableton_frontmost(self):
-        """Check if Ableton Live is the frontmost (active) application."""
+    def watch_frontmost_app(self):
+        """Subscribe to app-activation notifications and cache whether
+        Ableton is frontmost, so checks are just an attribute read instead
+        of a PyObjC round-trip.
+        """
+        self._ableton_is_front = False
+        self._activation_observer = None
+        if self._ns_workspace is None:
+            return
         try:
-            from AppKit import NSWorkspace
-            active_app = NSWorkspace.sharedWorkspace().frontmostApplication()
+            workspace = self._ns_workspace
+
+            # Initialize from the current frontmost app
+            active_app = workspace.frontmostApplication()
             if active_app:
-                app_name = active_app.localizedName()
-                return "Live" in app_name or "Ableton" in app_name
-        except:
+                name = active_app.localizedName() or ""
+                self._ableton_is_front = "Live" in name or "Ableton" in name
+
+            def on_activate(notification):
+                info = notification.userInfo()
+                app = info.get("NSWorkspaceApplicationKey") if info else None
+                name = (app.localizedName() if app else None) or ""
+                self._ableton_is_front = "Live" in name or "Ableton" in name
+
+            self._activation_observer = workspace.notificationCenter().addObserverForName_object_queue_usingBlock_(
+                "NSWorkspaceDidActivateApplicationNotification", None, None, on_activate
+            )
+        except (AttributeError, OSError):
             pass
-        return False
+
+    def is_ableton_frontmost(self):
+        """Check if Ableton Live is the frontmost (active) application."""
+        return self._ableton_is_front
 
     def is_ableton_running(self):
-        """Check if Ableton Live is running (not necessarily frontmost)."""
+        """Check if Ableton Live is running (not necessarily frontmost).
+
+        The result is cached for 2 s — apps launch and quit on human
+        timescales, and the running-app scan crosses the PyObjC bridge
+        once per app.
+        """
+        if self._ns_workspace is None:
+            return False
+        now = time.monotonic()
+        cached_at, cached = self._ableton_cache
+        if now - cached_at < 2.0:
+            return cached
+        found = None
         try:
-            from AppKit import NSWorkspace
-            running_apps = NSWorkspace.sharedWorkspace().runningApplications()
-            for app in running_apps:
+            for app in self._ns_workspace.runningApplications():
                 name = app.localizedName() or ""
                 if "Live" in name or "Ableton" in name:
-                    return True
-        except:
+                    found = app
+                    break
+        except (AttributeError, OSError):
             pass
-        return False
-
-    def run_applescript(self, script):
-        try:
-            p = subprocess.Popen(['osascript', '-e', script], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            p.communicate()
-            return p.returncode == 0
-        except:
-            return False
+        self._ableton_app = found
+        self._ableton_cache = (now, found is not None)
+        return found is not None
 
     def perform_save(self):
         """Save Ableton project using Quartz CGEvent (bypasses osascript permissions)."""
         try:
-            from AppKit import NSWorkspace
-            from Quartz import (
-                CGEventCreateKeyboardEvent, CGEventSetFlags, CGEventPost,
-                kCGHIDEventTap, kCGEventFlagMaskCommand
-            )
-
-            # Activate Ableton
-            running_apps = NSWorkspace.sharedWorkspace().runningApplications()
-            activated = False
-            for app in running_apps:
-                name = app.localizedName() or ""
-                if "Live" in name or "Ableton" in name:
-                    app.activateWithOptions_(0)
-                    activated = True
-                    break
-
-            if not activated:
+            # Activate Ableton via the handle cached by is_ableton_running
+            # instead of re-enumerating every running app
+            app = self._ableton_app
+            if app is None or app.isTerminated():
+                self._ableton_cache = (0.0, False)  # force a fresh scan
+                self.is_ableton_running()
+                app = self._ableton_app
+
+            if app is not None:
+                app.activateWithOptions_(0)
+            else:
                 self.lbl_last_saved.setText(f"Ableton not found @ {time.strftime('%H:%M:%S')}")
                 self.lbl_last_saved.setStyleSheet(f"color: {COLOR_DANGER}; font-family: 'Helvetica Neue'; font-size: 10px;")
                 return
@@ -1045,92 +1445,97 @@ class TriangleSaver(QMainWindow):
         """Enter recording mode — next key combo will become the shortcut."""
         self.is_recording_shortcut = True
         self.shortcut_input.setText("Press keys...")
-        self.shortcut_input.setStyleSheet(f"""
-            QPushButton {{
-                background-color: #0a0a0a;
-                color: {COLOR_DANGER};
-                border: 2px solid {COLOR_DANGER};
-                border-radius: 14px;
-                font-family: 'Helvetica Neue';
-                font-size: 11px;
-                font-weight: bold;
-            }}
-        """)
+        self.shortcut_input.setProperty("recording", True)
+        _repolish(self.shortcut_input)
+
+    def _remove_shortcut_monitors(self):
+        """Remove the NSEvent key monitors, if registered."""
+        for attr in ('global_monitor', 'local_monitor'):
+            monitor = getattr(self, attr)
+            if monitor:
+                try:
+                    NSEvent.removeMonitor_(monitor)
+                except AttributeError:
+                    pass
+                setattr(self, attr, None)
 
     def register_global_shortcut(self):
-        """Register a global hotkey using macOS NSEvent global monitor."""
-        # Remove previous monitor if any
-        if hasattr(self, 'global_monitor') and self.global_monitor:
-            try:
-                from AppKit import NSEvent
-                NSEvent.removeMonitor_(self.global_monitor)
-            except:
-                pass
-            self.global_monitor = None
-
-        if not hasattr(self, 'current_shortcut') or not self.current_shortcut:
+        """Register a global hotkey using macOS NSEvent monitors."""
+        # Remove previous monitors if any
+        self._remove_shortcut_monitors()
+
+        if not self.current_shortcut:
+            return
+        if NSEvent is None:
             return
 
         try:
-            from AppKit import NSEvent
-            # NSKeyDownMask = 1 << 10
-            NSKeyDownMask = 1 << 10
-
             target_modifiers, target_key = self.current_shortcut
             target_key_char = QKeySequence(target_key).toString().lower()
 
+            # macOS modifier flag bits
+            NSShiftKeyMask = 1 << 17
+            NSControlKeyMask = 1 << 18
+            NSAlternateKeyMask = 1 << 19
+            NSCommandKeyMask = 1 << 20
+            mod_mask = (NSShiftKeyMask | NSControlKeyMask
+                        | NSAlternateKeyMask | NSCommandKeyMask)
+
+            need_mask = 0
+            if target_modifiers & Qt.KeyboardModifier.ControlModifier:
+                need_mask |= NSControlKeyMask
+            if target_modifiers & Qt.KeyboardModifier.ShiftModifier:
+                need_mask |= NSShiftKeyMask
+            if target_modifiers & Qt.KeyboardModifier.AltModifier:
+                need_mask |= NSAlternateKeyMask
+            if target_modifiers & Qt.KeyboardModifier.MetaModifier:
+                need_mask |= NSCommandKeyMask
+
             def handler(event):
+                # Runs for every keydown system-wide: reject on the cheap
+                # integer mask compare before touching the key string
+                if (event.modifierFlags() & mod_mask) != need_mask:
+                    return event
                 chars = event.charactersIgnoringModifiers()
                 if chars and chars.lower() == target_key_char:
-                    flags = event.modifierFlags()
-                    # Check modifiers (macOS flags)
-                    need_ctrl = bool(target_modifiers & Qt.KeyboardModifier.ControlModifier)
-                    need_shift = bool(target_modifiers & Qt.KeyboardModifier.ShiftModifier)
-                    need_alt = bool(target_modifiers & Qt.KeyboardModifier.AltModifier)
-                    need_cmd = bool(target_modifiers & Qt.KeyboardModifier.MetaModifier)
-
-                    has_ctrl = bool(flags & (1 << 18))   # NSControlKeyMask
-                    has_shift = bool(flags & (1 << 17))  # NSShiftKeyMask
-                    has_alt = bool(flags & (1 << 19))    # NSAlternateKeyMask
-                    has_cmd = bool(flags & (1 << 20))    # NSCommandKeyMask
-
-                    if (need_ctrl == has_ctrl and need_shift == has_shift
-                            and need_alt == has_alt and need_cmd == has_cmd):
-                        QTimer.singleShot(0, self.toggle_window_visibility)
+                    # Queued invoke marshals to the Qt thread without the
+                    # zero-length precise timer singleShot(0) would spin up
+                    QMetaObject.invokeMethod(
+                        self, 'toggle_window_visibility',
+                        Qt.ConnectionType.QueuedConnection
+                    )
                 return event
 
             self.global_monitor = NSEvent.addGlobalMonitorForEventsMatchingMask_handler_(
                 NSKeyDownMask, handler
             )
+            # Global monitors never see our own app's keystrokes — a local
+            # monitor covers the shortcut while this window has focus
+            self.local_monitor = NSEvent.addLocalMonitorForEventsMatchingMask_handler_(
+                NSKeyDownMask, handler
+            )
         except Exception as e:
             print(f"Failed to register global shortcut: {e}")
 
     def close_app(self):
         """Hide the window instead of quitting. App stays in menu bar."""
         self.hide()
-        self.action_show_hide.setText("Show Window")
+        self._set_show_hide_text("Show Window")
 
     # --- Mouse events for dragging and resizing ---
-    def _get_resize_edge(self, global_pos):
-        """Determine which edge/corner the mouse is near, or None for drag area."""
+    def _get_resize_mask(self, global_pos):
+        """4-bit edge mask for the mouse position (see _EDGE_TABLE layout)."""
         local = self.mapFromGlobal(global_pos)
         rect = self.rect()
         m = self.resize_margin
+        return ((local.x() <= m)
+                | ((local.x() >= rect.width() - m) << 1)
+                | ((local.y() <= m) << 2)
+                | ((local.y() >= rect.height() - m) << 3))
 
-        on_left = local.x() <= m
-        on_right = local.x() >= rect.width() - m
-        on_top = local.y() <= m
-        on_bottom = local.y() >= rect.height() - m
-
-        if on_top and on_left:     return 'top-left'
-        if on_top and on_right:    return 'top-right'
-        if on_bottom and on_left:  return 'bottom-left'
-        if on_bottom and on_right: return 'bottom-right'
-        if on_left:                return 'left'
-        if on_right:               return 'right'
-        if on_top:                 return 'top'
-        if on_bottom:              return 'bottom'
-        return None
+    def _get_resize_edge(self, global_pos):
+        """Determine which edge/corner the mouse is near, or None for drag area."""
+        return _EDGE_TABLE[self._get_resize_mask(global_pos)]
 
     def eventFilter(self, obj, event):
         """Intercept mouse events from the QGraphicsView viewport for drag/resize."""
@@ -1156,24 +1561,13 @@ class TriangleSaver(QMainWindow):
             global_pos = event.globalPosition().toPoint()
 
             if event.buttons() == Qt.MouseButton.NoButton:
-                # Hovering — update cursor
-                edge = self._get_resize_edge(global_pos)
-                cursor_map = {
-                    'left': Qt.CursorShape.SizeHorCursor,
-                    'right': Qt.CursorShape.SizeHorCursor,
-                    'top': Qt.CursorShape.SizeVerCursor,
-                    'bottom': Qt.CursorShape.SizeVerCursor,
-                    'top-left': Qt.CursorShape.SizeFDiagCursor,
-                    'bottom-right': Qt.CursorShape.SizeFDiagCursor,
-                    'top-right': Qt.CursorShape.SizeBDiagCursor,
-                    'bottom-left': Qt.CursorShape.SizeBDiagCursor,
-                }
-                cursor = cursor_map.get(edge, Qt.CursorShape.ArrowCursor)
+                # Hovering — update cursor straight from the mask table
+                cursor = _CURSOR_TABLE[self._get_resize_mask(global_pos)]
                 self.graphics_view.viewport().setCursor(QCursor(cursor))
                 return False
 
             if event.buttons() == Qt.MouseButton.LeftButton:
-                if self.resize_edge and hasattr(self, 'resize_start_pos'):
+                if self.resize_edge and self.resize_start_pos is not None:
                     # Resizing
                     delta = global_pos - self.resize_start_pos
                     geo = QRect(self.resize_start_geo)
@@ -1190,8 +1584,11 @@ class TriangleSaver(QMainWindow):
                     # Enforce min/max size
                     if (geo.width() >= self.minimumWidth() and geo.height() >= self.minimumHeight()
                             and geo.width() <= self.maximumWidth() and geo.height() <= self.maximumHeight()):
-                        self.setGeometry(geo)
-                        self.update_scale()
+                        # Coalesce: keep only the latest geometry and apply
+                        # it on the 16 ms throttle tick
+                        self._pending_geo = geo
+                        if not self._resize_throttle.isActive():
+                            self._resize_throttle.start()
                     return True  # Consume event
 
                 elif self.drag_position:
@@ -1200,19 +1597,50 @@ class TriangleSaver(QMainWindow):
                     return True  # Consume event
 
         elif event.type() == QEvent.Type.MouseButtonRelease:
+            # Flush any geometry still pending from the resize throttle
+            self._resize_throttle.stop()
+            self._apply_pending_geo()
             self.resize_edge = None
             self.drag_position = None
 
         return super().eventFilter(obj, event)
 
+    def _apply_pending_geo(self):
+        """Apply the most recent geometry from an interactive resize."""
+        if self._pending_geo is None:
+            return
+        geo, self._pending_geo = self._pending_geo, None
+        # Integer rounding often produces the same rect on consecutive
+        # mouse moves — nothing to do then
+        if geo == self.geometry():
+            return
+        self.setGeometry(geo)
+        self.update_scale()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        # Label updates are skipped while hidden — force a refresh
+        self._last_remaining = None
+        if not self._centered_once:
+            self._centered_once = True
+            # Center within the available (non-dock/menubar) area of the
+            # screen the window actually landed on
+            screen = self.screen().availableGeometry()
+            x = screen.x() + (screen.width() - self.width()) // 2
+            y = screen.y() + (screen.height() - self.height()) // 2
+            self.move(x, y)
+
     def resizeEvent(self, event):
         """Update the UI scale whenever the window is resized."""
         super().resizeEvent(event)
-        self.update_scale()
+        # Pure moves also land here with an unchanged size — no rescale
+        if event.size() == event.oldSize():
+            return
+        self._rescale_timer.start()
 
     def keyPressEvent(self, event):
         # Shortcut recording mode
-        if hasattr(self, 'is_recording_shortcut') and self.is_recording_shortcut:
+        if self.is_recording_shortcut:
             modifiers = event.modifiers()
             key = event.key()
 
@@ -1220,41 +1648,24 @@ class TriangleSaver(QMainWindow):
             if key in (Qt.Key.Key_Control, Qt.Key.Key_Shift, Qt.Key.Key_Alt, Qt.Key.Key_Meta):
                 return
 
-            # Build the display string
-            parts = []
-            if modifiers & Qt.KeyboardModifier.ControlModifier:
-                parts.append("Ctrl")
-            if modifiers & Qt.KeyboardModifier.ShiftModifier:
-                parts.append("Shift")
-            if modifiers & Qt.KeyboardModifier.AltModifier:
-                parts.append("Alt")
-            if modifiers & Qt.KeyboardModifier.MetaModifier:
-                parts.append("Cmd")
+            # Build the display string from the precomputed prefix table
+            mask = (bool(modifiers & Qt.KeyboardModifier.ControlModifier)
+                    | (bool(modifiers & Qt.KeyboardModifier.ShiftModifier) << 1)
+                    | (bool(modifiers & Qt.KeyboardModifier.AltModifier) << 2)
+                    | (bool(modifiers & Qt.KeyboardModifier.MetaModifier) << 3))
 
             key_name = QKeySequence(key).toString()
             if key_name:
-                parts.append(key_name)
-
-            shortcut_str = "+".join(parts)
+                shortcut_str = _MOD_PREFIX[mask] + key_name
+            else:
+                shortcut_str = _MOD_PREFIX[mask][:-1]  # drop trailing '+'
             self.shortcut_input.setText(shortcut_str)
             self.current_shortcut = (modifiers, key)
             self.is_recording_shortcut = False
 
             # Restore button style
-            self.shortcut_input.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: #0a0a0a;
-                    color: {COLOR_ACCENT};
-                    border: 1px solid #333333;
-                    border-radius: 14px;
-                    font-family: 'Helvetica Neue';
-                    font-size: 11px;
-                    font-weight: bold;
-                }}
-                QPushButton:hover {{
-                    border-color: {COLOR_ACCENT};
-                }}
-            """)
+            self.shortcut_input.setProperty("recording", False)
+            _repolish(self.shortcut_input)
 
             # Re-register global monitor with new shortcut
             self.register_global_shortcut()